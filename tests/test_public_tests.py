@@ -1,6 +1,6 @@
 # Import your implementation in the public tests
 from traits.implementation import Traits, TraitsUtility
-from public.traits.interface import TraitsKey, TrainStatus, SortingCriteria
+from public.traits.interface import TraitsKey, TrainStatus, SortingCriteria, UserRejectionReason
 import pytest
 
 
@@ -78,6 +78,24 @@ def test_buy_ticket(rdbms_connection, rdbms_admin_connection, neo4j_db):
        t.buy_ticket(user_email, connection, also_reserve_seats)
 
 
+def test_no_seats_availability_if_no_trips_are_given(rdbms_connection, rdbms_admin_connection, neo4j_db):
+    utils = TraitsUtility(rdbms_connection, rdbms_admin_connection, neo4j_db)
+    no_availability = utils.get_seats_availability([])
+
+    assert len(no_availability) == 0, "Wrong availability returned for no trips"
+
+
+def test_seats_availability_if_train_does_not_exist(rdbms_connection, rdbms_admin_connection, neo4j_db):
+    utils = TraitsUtility(rdbms_connection, rdbms_admin_connection, neo4j_db)
+
+    # This train is not stored in the db
+    train_key = TraitsKey("1")
+    trips = [(train_key, 1, 1, 2024, 0, 1)]
+
+    with pytest.raises(ValueError) as exc_info:
+        utils.get_seats_availability(trips)
+
+
 def test_get_empty_purchase_history_if_user_not_registered(rdbms_connection, rdbms_admin_connection, neo4j_db):
      t = Traits(rdbms_connection, rdbms_admin_connection, neo4j_db)
      user_email = "user@email.org"
@@ -107,6 +125,27 @@ def test_do_not_add_duplicated_user(rdbms_connection, rdbms_admin_connection, ne
         t.add_user(user_email, user_details)
 
 
+def test_add_many_users_reports_invalid_and_duplicated_emails(rdbms_connection, rdbms_admin_connection, neo4j_db):
+    t = Traits(rdbms_connection, rdbms_admin_connection, neo4j_db)
+    utils = TraitsUtility(rdbms_connection, rdbms_admin_connection, neo4j_db)
+
+    # Get the number of currently registered users
+    currently_registerd_users = len(utils.get_all_users())
+
+    user_details = None
+    users = [
+        ("user_1@email.org", user_details),
+        ("this is not a valid email address", user_details),
+        ("user_2@email.org", user_details),
+        ("user_1@email.org", user_details),
+    ]
+    # Use a small batch to make sure rejected users do not abort the following batches
+    rejected_users = t.add_users_many(users, batch_size=2)
+
+    assert rejected_users == [(1, UserRejectionReason.INVALID_EMAIL), (3, UserRejectionReason.DUPLICATED_EMAIL)], f"Wrong rejected users {rejected_users}"
+    assert len(utils.get_all_users()) == currently_registerd_users + 2, "Valid users not inserted"
+
+
 def test_delete_user_from_an_empty_db(rdbms_connection, rdbms_admin_connection, neo4j_db):
     t = Traits(rdbms_connection, rdbms_admin_connection, neo4j_db)
     utils = TraitsUtility(rdbms_connection, rdbms_admin_connection, neo4j_db)
@@ -33,7 +33,19 @@ class TrainStatus(Enum):
     BROKEN = 2
 
 
+class UserRejectionReason(Enum):
+    INVALID_EMAIL = 0
+    DUPLICATED_EMAIL = 1
+
+
 class SortingCriteria(Enum):
+    """
+    Criteria to sort the connections returned by search_connections. For each connection:
+        - OVERALL_TRAVEL_TIME: minutes from the beginning of the trip to its very end
+        - NUMBER_OF_TRAIN_CHANGES: how many times the user must change the train
+        - OVERALL_WAITING_TIME: minutes spent waiting for trains, including the first one
+        - ESTIMATED_PRICE: travel time (without waiting times and delays) / 2 + 2 * number of trains
+    """
     OVERALL_TRAVEL_TIME = 0
     NUMBER_OF_TRAIN_CHANGES = 1
     OVERALL_WAITING_TIME = 2
@@ -77,6 +89,22 @@ class TraitsUtilityInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_seats_availability(self, trips: List[Tuple[TraitsKey, int, int, int, int, int]]) -> List[int]:
+        """
+        Return how many seats can still be reserved along each of the given trips, in the same order.
+        Each trip is a tuple (train_key, day, month, year, from_stop, to_stop), where from_stop and
+        to_stop are the (0-based) positions of the boarding and leaving stations in the train schedule.
+
+        The seats left on a trip are the train capacity minus the maximum number of reserved seats
+        on any leg between from_stop and to_stop on that service date. buy_ticket must use the same
+        rule to decide whether a seat can be reserved.
+
+        Returns an empty list if no trips are given.
+        Raise a ValueError if the train does not exist or the stops are not valid for its schedule
+        """
+        pass
+
 
 class TraitsInterface(ABC):
     """
@@ -103,8 +131,13 @@ class TraitsInterface(ABC):
         Sorting criteria can be one of the following:overall travel time, number of train changes, waiting time, and estimated price
 
         Return the connections from a starting and ending stations, possibly including changes at interchanging stations.
+        Connections are scored by sort_by, ordered ascending or descending (is_ascending), and
+        at most limit of them are returned, i.e., the best limit connections w.r.t. the criteria.
         Returns an empty list if no connections are possible
         Raise a ValueError in case of errors and if the starting or ending stations are the same
+
+        Searches must not be blocked by concurrent timetable changes (add_schedule, connect_train_stations,
+        delete_train, ...). Each search sees the timetable either entirely before or entirely after a change.
         """
         pass
 
@@ -165,6 +198,20 @@ class TraitsInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_users_many(self, users: List[Tuple[str, object]], batch_size: int = 1000) -> List[Tuple[int, UserRejectionReason]]:
+        """
+        Add many users to the system at once. Each user is a tuple (user_email, user_details).
+        Users are sent to the database in batches of (at most) batch_size users, and emails are
+        validated in the database with the same rule used by add_user.
+
+        Invalid or duplicated users (already stored or repeated in the given list) do not abort the
+        batch: all the other users are added, and the rejected ones are returned as a list of
+        (position in users, reason), sorted by position. Returns an empty list if all users are added.
+        Raise a ValueError if batch_size is not positive
+        """
+        pass
+
     @abstractmethod
     def delete_user(self, user_email: str) -> None:
         """
@@ -195,6 +242,7 @@ class TraitsInterface(ABC):
     def delete_train(self, train_key: TraitsKey) -> None:
         """
         Drop the train from the system. Note that all its schedules, reservations, etc. must be also dropped.
+        The change becomes visible to search_connections at once, never partially.
         """
         pass
 
@@ -212,6 +260,7 @@ class TraitsInterface(ABC):
         Connect to train station so trains can travel on them
         Raise ValueError if any of the stations does not exist
         Raise ValueError for invalid travel_times
+        The new connection becomes visible to search_connections at once, never partially.
         """
         pass
 
@@ -229,5 +278,6 @@ class TraitsInterface(ABC):
         starting hours and minutes defines when this schedule is active
         Validity dates must ensure that valid_from is in the past w.r.t. valid_until
         In case of error, raise ValueError
+        The new schedule becomes visible to search_connections at once, never partially.
         """
         pass